@@ -48,18 +48,158 @@ import matplotlib
 matplotlib.use('TkAgg')
 import numpy as np
 import pandas as pd
+from scipy import sparse
 import matplotlib.pyplot as plt
-from itertools import chain, combinations
+import os
+import sys
+import csv
+import json
+import tempfile
+import time
+from statistics import NormalDist
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from itertools import chain, combinations, repeat
 from typing import Set, Tuple, List, Dict, FrozenSet
 
+def set_to_bits(S) -> int:
+    """Encode a set of indices as a bitset (bit i is set ⟺ i ∈ S)"""
+    bits = 0
+    for i in S:
+        bits |= 1 << i
+    return bits
+
+
+def iter_bits(bits: int):
+    """Yield the indices of the set bits in ascending order"""
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
+def bits_to_set(bits: int) -> Set[int]:
+    """Decode a bitset into a set of indices"""
+    return set(iter_bits(bits))
+
+
+def _pack_rows(matrix: np.ndarray) -> List[int]:
+    """
+    Pack every row of a binary matrix into a Python int (bit j = column j).
+    Packing goes through np.packbits, so no per-cell Python work is done.
+    """
+    packed = np.packbits(np.asarray(matrix, dtype=bool), axis=1, bitorder='little')
+    return [int.from_bytes(row.tobytes(), 'little') for row in packed]
+
+
+def _n_bytes(n_bits: int) -> int:
+    """Bytes needed to store a bitset of n_bits"""
+    return (n_bits + 7) // 8
+
+
+def _next_closed_bits(a: int, n: int, closure) -> int | None:
+    """
+    Next Closure step on bitsets over {0, ..., n-1}: the lectically next set
+    after A that is closed under `closure`, or None if A is the last one
+    """
+    # Try to increment from right to left
+    for i in range(n - 1, -1, -1):
+        bit = 1 << i
+        if a & bit:
+            # Remove element i for next iteration
+            a ^= bit
+        else:
+            a_closure = closure(a | bit)
+            
+            # Valid if the closure adds no element < i outside A
+            if not a_closure & ~a & (bit - 1):
+                return a_closure
+    
+    return None
+
+
+class ClosureCache:
+    """
+    Bounded LRU memo for the derivation operators, keyed by argument bitset
+    Least recently used entries are evicted once max_entries or max_bytes
+    (approximate size of the cached keys and values) is exceeded.
+    """
+    
+    def __init__(self, max_entries: int = 100_000, max_bytes: int = 64 * 2**20):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.n_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, key) -> int | None:
+        result = self.entries.get(key)
+        if result is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.entries.move_to_end(key)
+        return result
+    
+    def put(self, key, value: int):
+        if key in self.entries:
+            return
+        self.entries[key] = value
+        self.n_bytes += _entry_size(key, value)
+        while self.entries and (len(self.entries) > self.max_entries or self.n_bytes > self.max_bytes):
+            old_key, old_value = self.entries.popitem(last=False)
+            self.n_bytes -= _entry_size(old_key, old_value)
+            self.evictions += 1
+    
+    def clear(self):
+        self.entries.clear()
+        self.n_bytes = 0
+    
+    def stats(self) -> Dict[str, float]:
+        """Counters for tuning: hits, misses, hit rate, evictions, size"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'entries': len(self.entries),
+            'bytes': self.n_bytes,
+        }
+
+
+def _entry_size(key, value: int) -> int:
+    """Approximate memory held by one cache entry (key tuple, bitsets, dict slot)"""
+    return sys.getsizeof(key) + sys.getsizeof(key[1]) + sys.getsizeof(value) + 100
+
+
 class FormalContext:
     """
     Formal Context (G, M, I) where:
     - G: set of objects (rows)
     - M: set of attributes (columns)
     - I: binary relation I ⊆ G × M
+
+    Internally the relation is also kept as bitsets (Python big-ints):
+    - row_bits[g]: attributes of object g  (g↑)
+    - col_bits[m]: objects having attribute m  (m↓)
+    The closure operators AND-reduce these words; the set-based API
+    (up_arrow, down_arrow, closure, ...) is a thin wrapper over them.
     """
     
+    # Number of A↑ computations, i.e. closures computed (see ordering_report)
+    closure_count = 0
+    
+    def __new__(cls, *args, **kwargs):
+        # scipy.sparse incidence gets the index-based implementation
+        incidence = args[2] if len(args) > 2 else kwargs.get('incidence')
+        if cls is FormalContext and sparse.issparse(incidence):
+            cls = SparseFormalContext
+        return super().__new__(cls)
+    
     def __init__(self, objects: List[str], attributes: List[str], incidence: np.ndarray):
         self.G = objects  # Objects
         self.M = attributes  # Attributes
@@ -67,52 +207,173 @@ class FormalContext:
         self.n_objects = len(objects)
         self.n_attributes = len(attributes)
         
-    def up_arrow(self, A: Set[int]) -> Set[int]:
+        # Bitset representation of I
+        self.row_bits = _pack_rows(incidence)
+        self.col_bits = _pack_rows(np.asarray(incidence).T)
+        self.all_objects = (1 << self.n_objects) - 1
+        self.all_attributes = (1 << self.n_attributes) - 1
+        self.cache = None  # Optional ClosureCache, see enable_cache()
+    
+    @classmethod
+    def _from_bits(cls, n_objects: int, n_attributes: int,
+                   row_bits: List[int], col_bits: List[int]) -> 'FormalContext':
         """
-        A↑ = {m ∈ M | ∀g ∈ A: (g,m) ∈ I}
-        Returns attributes shared by ALL objects in A
+        Build a context directly from its bitsets, with objects and attributes
+        named by their index and no dense incidence matrix
         """
-        if not A:
-            # Empty set maps to all attributes
-            return set(range(self.n_attributes))
-        
-        # Start with all attributes of first object
-        result = set(np.where(self.I[list(A)[0], :])[0])
+        context = cls.__new__(cls)
+        context.G = list(range(n_objects))
+        context.M = list(range(n_attributes))
+        context.I = None
+        context.n_objects = n_objects
+        context.n_attributes = n_attributes
+        context.row_bits = row_bits
+        context.col_bits = col_bits
+        context.all_objects = (1 << n_objects) - 1
+        context.all_attributes = (1 << n_attributes) - 1
+        context.cache = None
+        return context
+    
+    def add_object(self, name: str, row, lattice: 'ConceptLattice | None' = None) -> int:
+        """
+        Append a new object with incidence row `row` to the context
+        If a lattice of this context is given, it is updated in place
+        Returns the index of the new object
+        """
+        row = np.asarray(row)
+        g = self.n_objects
+        bits = _pack_rows(row[np.newaxis, :])[0]
         
-        # Intersect with attributes of remaining objects
-        for g in list(A)[1:]:
-            result &= set(np.where(self.I[g, :])[0])
+        self.G = list(self.G) + [name]
+        if self.I is not None:
+            self.I = np.vstack([self.I, row])
+        self.row_bits.append(bits)
+        for m in iter_bits(bits):
+            self.col_bits[m] |= 1 << g
+        self.n_objects += 1
+        self.all_objects = (1 << self.n_objects) - 1
+        if self.cache is not None:
+            self.cache.clear()
         
+        if lattice is not None:
+            lattice.add_object(g, bits)
+        return g
+    
+    def object_intent(self, g: int) -> int:
+        """g↑ as a bitset"""
+        return self.row_bits[g]
+    
+    def attribute_extent(self, m: int) -> int:
+        """m↓ as a bitset"""
+        return self.col_bits[m]
+    
+    def enable_cache(self, max_entries: int = 100_000, max_bytes: int = 64 * 2**20) -> 'ClosureCache':
+        """
+        Memoize up_bits/down_bits in a bounded LRU cache
+        Returns the cache, whose hit/miss counters can be inspected
+        """
+        self.cache = ClosureCache(max_entries, max_bytes)
+        return self.cache
+    
+    def disable_cache(self):
+        self.cache = None
+    
+    def up_bits(self, a: int) -> int:
+        """
+        A↑ on bitsets (memoized if a cache is enabled)
+        """
+        self.closure_count += 1
+        if self.cache is None:
+            return self._up_bits(a)
+        key = ('up', a)
+        result = self.cache.get(key)
+        if result is None:
+            result = self._up_bits(a)
+            self.cache.put(key, result)
+        return result
+    
+    def down_bits(self, b: int) -> int:
+        """
+        B↓ on bitsets (memoized if a cache is enabled)
+        """
+        if self.cache is None:
+            return self._down_bits(b)
+        key = ('down', b)
+        result = self.cache.get(key)
+        if result is None:
+            result = self._down_bits(b)
+            self.cache.put(key, result)
+        return result
+    
+    def _up_bits(self, a: int) -> int:
+        """
+        A↑ on bitsets: AND of the rows of all objects in A
+        """
+        if a.bit_count() > self.n_attributes:
+            # Large A: cheaper to test each column once (A ⊆ m↓)
+            return sum(1 << m for m, col in enumerate(self.col_bits) if col & a == a)
+        result = self.all_attributes
+        rows = self.row_bits
+        while a and result:
+            low = a & -a
+            result &= rows[low.bit_length() - 1]
+            a ^= low
+        return result
+    
+    def _down_bits(self, b: int) -> int:
+        """
+        B↓ on bitsets: AND of the columns of all attributes in B
+        """
+        if b.bit_count() > self.n_objects:
+            # Large B: cheaper to test each row once (B ⊆ g↑)
+            return sum(1 << g for g, row in enumerate(self.row_bits) if row & b == b)
+        result = self.all_objects
+        cols = self.col_bits
+        while b and result:
+            low = b & -b
+            result &= cols[low.bit_length() - 1]
+            b ^= low
         return result
     
+    def closure_bits(self, a: int) -> int:
+        """Extent closure A↑↓ on bitsets"""
+        return self.down_bits(self.up_bits(a))
+    
+    def intent_closure_bits(self, b: int) -> int:
+        """Intent closure B↓↑ on bitsets"""
+        return self.up_bits(self.down_bits(b))
+    
+    def support(self, b: int) -> int:
+        """Number of objects having all attributes in B: |B↓| (popcount)"""
+        return self.down_bits(b).bit_count()
+        
+    def up_arrow(self, A: Set[int]) -> Set[int]:
+        """
+        A↑ = {m ∈ M | ∀g ∈ A: (g,m) ∈ I}
+        Returns attributes shared by ALL objects in A
+        """
+        # Empty set maps to all attributes
+        return bits_to_set(self.up_bits(set_to_bits(A)))
+    
     def down_arrow(self, B: Set[int]) -> Set[int]:
         """
         B↓ = {g ∈ G | ∀m ∈ B: (g,m) ∈ I}
         Returns objects that have ALL attributes in B
         """
-        if not B:
-            # Empty set maps to all objects
-            return set(range(self.n_objects))
-        
-        # Start with all objects having first attribute
-        result = set(np.where(self.I[:, list(B)[0]])[0])
-        
-        # Intersect with objects having remaining attributes
-        for m in list(B)[1:]:
-            result &= set(np.where(self.I[:, m])[0])
-        
-        return result
+        # Empty set maps to all objects
+        return bits_to_set(self.down_bits(set_to_bits(B)))
     
     def closure(self, A: Set[int]) -> Set[int]:
         """
         Closure of A: A↑↓ (apply up then down)
         Returns the smallest closed set containing A
         """
-        return self.down_arrow(self.up_arrow(A))
+        return bits_to_set(self.closure_bits(set_to_bits(A)))
     
     def is_closed(self, A: Set[int]) -> bool:
         """Check if A is closed: A = A↑↓"""
-        return A == self.closure(A)
+        a = set_to_bits(A)
+        return a == self.closure_bits(a)
     
     def is_formal_concept(self, A: Set[int], B: Set[int]) -> bool:
         """
@@ -120,85 +381,1654 @@ class FormalContext:
         - A↑ = B
         - B↓ = A
         """
-        return self.up_arrow(A) == B and self.down_arrow(B) == A
+        a, b = set_to_bits(A), set_to_bits(B)
+        return self.up_bits(a) == b and self.down_bits(b) == a
     
-    def generate_all_concepts(self) -> List[Tuple[FrozenSet[int], FrozenSet[int]]]:
+    def closure_batch(self, sets) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Closures of many object sets at once
+        `sets` is a boolean matrix of shape (k, |G|), one candidate set per row
+        Returns boolean arrays (extents, intents) of shapes (k, |G|) and (k, |M|):
+        intents[i] = A_i↑ and extents[i] = A_i↑↓
+        
+        Both derivations are packed-word AND-reductions in NumPy: the word rows
+        of all selected objects are gathered once and np.bitwise_and.reduceat
+        reduces every candidate's segment, so the cost is proportional to the
+        set sizes rather than |G|·|M| per candidate.
+        """
+        sets = np.asarray(sets, dtype=bool)
+        if sets.ndim != 2 or sets.shape[1] != self.n_objects:
+            raise ValueError(f"Expected a boolean matrix with {self.n_objects} columns, got shape {sets.shape}")
+        rows, cols = self._packed_words()
+        intents = _batch_and(rows, sets, self.n_attributes)
+        extents = _batch_and(cols, intents, self.n_objects)
+        return extents, intents
+    
+    def _packed_words(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Rows (g↑) and columns (m↓) as packed little-endian uint64 words"""
+        row_words, col_words = _n_words(self.n_attributes), _n_words(self.n_objects)
+        rows = np.array([_int_to_words(self.object_intent(g), row_words) for g in range(self.n_objects)],
+                        dtype='<u8').reshape(self.n_objects, row_words)
+        cols = np.array([_int_to_words(self.attribute_extent(m), col_words) for m in range(self.n_attributes)],
+                        dtype='<u8').reshape(self.n_attributes, col_words)
+        return rows, cols
+    
+    def generate_all_concepts(self, min_support: int = 0) -> List[Tuple[FrozenSet[int], FrozenSet[int]]]:
         """
         Generate all formal concepts by testing all possible extents
         Theorem: Every closed set forms the extent of exactly one concept
+        Only extents with at least min_support objects are tested
         """
         concepts = []
         
         # Test all subsets of objects
         for A_tuple in chain.from_iterable(
             combinations(range(self.n_objects), r) 
-            for r in range(self.n_objects + 1)
+            for r in range(min_support, self.n_objects + 1)
         ):
-            A = set(A_tuple)
+            a = set_to_bits(A_tuple)
             
-            # Check if A is closed
-            if self.is_closed(A):
-                B = self.up_arrow(A)
-                
-                # Verify it's a formal concept
-                if self.is_formal_concept(A, B):
-                    concepts.append((frozenset(A), frozenset(B)))
+            # Check if A is closed; (A, A↑) is then a formal concept
+            b = self.up_bits(a)
+            if self.down_bits(b) == a:
+                concepts.append((frozenset(A_tuple), frozenset(iter_bits(b))))
         
         return concepts
     
-    def next_closure_algorithm(self) -> List[Tuple[FrozenSet[int], FrozenSet[int]]]:
+    def next_closure_algorithm(self, min_support: int = 0) -> List[Tuple[FrozenSet[int], FrozenSet[int]]]:
         """
         Next Closure Algorithm (Ganter's algorithm)
         Efficiently generates all closed sets in lexicographic order
         
         This proves the theorem: all concepts are found by closure operations
         """
-        concepts = []
+        return list(self.iter_concepts(min_support=min_support))
+    
+    def iter_concepts(self, resume_from: Set[int] | None = None, min_support: int = 0):
+        """
+        Lazily yield the concepts (extent, intent) found by Next Closure,
+        in lectic order of their extents
         
-        # Start with empty set
-        A = set()
+        The generator can be abandoned at any point. The extent of the last
+        concept consumed is the resume token: passing it as `resume_from`
+        continues with the concept that follows it.
         
-        while A is not None:
-            # Get the intent (attributes)
-            B = self.up_arrow(A)
-            
-            # Verify and store the concept
-            if self.is_formal_concept(A, B):
-                concepts.append((frozenset(A), frozenset(B)))
-            
-            # Find next closed set
-            A = self._next_closure(A)
+        The lectic order of extents does not follow support, so concepts with
+        fewer than min_support objects are skipped rather than pruned.
+        """
+        if resume_from is None:
+            # The lectically smallest closed set is ∅↑↓
+            a = self.closure_bits(0)
+        else:
+            a = _next_closed_bits(set_to_bits(resume_from), self.n_objects, self.closure_bits)
         
-        return concepts
+        while a is not None:
+            if a.bit_count() >= min_support:
+                yield frozenset(iter_bits(a)), frozenset(iter_bits(self.up_bits(a)))
+            a = _next_closed_bits(a, self.n_objects, self.closure_bits)
     
     def _next_closure(self, A: Set[int]) -> Set[int] | None:
         """
         Find the next closed set after A in lexicographic order
         Returns None if A is the last closed set
         """
-        # Try to increment from right to left
-        for i in range(self.n_objects - 1, -1, -1):
-            if i not in A:
-                # Try adding element i
-                A_new = A | {i}
-                
-                # Compute closure
-                A_closure = self.closure(A_new)
-                
-                # Check if closure doesn't contain elements < i outside A
-                valid = True
-                for j in range(i):
-                    if j in A_closure and j not in A:
-                        valid = False
-                        break
-                
-                if valid:
-                    return A_closure
+        a = _next_closed_bits(set_to_bits(A), self.n_objects, self.closure_bits)
+        return None if a is None else bits_to_set(a)
+    
+    def canonical_basis(self) -> 'Implications':
+        """
+        Duquenne–Guigues (stem) basis: P → P↓↑ for every pseudo-intent P
+        
+        Ganter's algorithm: Next Closure over attribute sets, where the closure
+        operator is the closure under the implications found so far (computed
+        with LinClosure). Its closed sets are exactly the intents and the
+        pseudo-intents, visited in lectic order, so every pseudo-intent is met
+        after all pseudo-intents it contains.
+        """
+        basis = Implications(self.n_attributes)
+        a = 0
+        while a is not None:
+            closed = self.intent_closure_bits(a)
+            if closed != a:
+                basis.add(a, closed & ~a)
+            a = _next_closed_bits(a, self.n_attributes, basis.closure_bits)
+        return basis
+    
+    def reduce(self) -> Tuple['FormalContext', 'ContextReduction']:
+        """
+        Clarify and reduce the context without changing its concept lattice
+        
+        - Clarify: objects with the same intent (attributes with the same
+          extent) are merged, grouping the bit rows in a dict keyed by the row
+        - Reduce: an object g is dropped if g↑ is the intersection of strictly
+          larger object intents, i.e. (g↑↓ minus g's group)↑ = g↑; dually for
+          attributes
+        
+        Returns the reduced context, named after the kept representatives,
+        and a ContextReduction that expands its concepts back to the
+        original objects and attributes.
+        """
+        object_groups = _group_bits(self.object_intent(g) for g in range(self.n_objects))
+        attribute_groups = _group_bits(self.attribute_extent(m) for m in range(self.n_attributes))
+        
+        def irreducible(groups, derive, derive_back):
+            kept = []
+            for row, members in groups.items():
+                # Intersection of the strictly larger rows (all of M or G if none)
+                if derive_back(derive(row) & ~members) != row:
+                    kept.append(row)
+            return kept
+        
+        kept_objects = irreducible(object_groups, self.down_bits, self.up_bits)
+        kept_attributes = irreducible(attribute_groups, self.up_bits, self.down_bits)
+        object_reps = [(object_groups[row] & -object_groups[row]).bit_length() - 1 for row in kept_objects]
+        attribute_reps = [(attribute_groups[col] & -attribute_groups[col]).bit_length() - 1 for col in kept_attributes]
+        
+        object_pos = np.full(self.n_objects, -1, dtype=np.int64)
+        object_pos[object_reps] = np.arange(len(object_reps))
+        attribute_pos = np.full(self.n_attributes, -1, dtype=np.int64)
+        attribute_pos[attribute_reps] = np.arange(len(attribute_reps))
+        n, m = len(object_reps), len(attribute_reps)
+        
+        reduced = FormalContext._from_bits(
+            n, m,
+            [_compress_bits(row, self.n_attributes, attribute_pos, m) for row in kept_objects],
+            [_compress_bits(col, self.n_objects, object_pos, n) for col in kept_attributes])
+        reduced.G = [self.G[g] for g in object_reps]
+        reduced.M = [self.M[a] for a in attribute_reps]
+        
+        kept_object_rows, kept_attribute_cols = set(kept_objects), set(kept_attributes)
+        mapping = ContextReduction(
+            self.n_objects, self.n_attributes,
+            [object_groups[row] for row in kept_objects],
+            [attribute_groups[col] for col in kept_attributes],
+            [(members, _compress_bits(row, self.n_attributes, attribute_pos, m))
+             for row, members in object_groups.items() if row not in kept_object_rows],
+            [(members, _compress_bits(col, self.n_objects, object_pos, n))
+             for col, members in attribute_groups.items() if col not in kept_attribute_cols])
+        return reduced, mapping
+    
+    def fcbo_algorithm(self, min_support: int = 0) -> List[Tuple[FrozenSet[int], FrozenSet[int]]]:
+        """
+        Fast Close-by-One (Outrata & Vychodil)
+        Depth-first search over intents: a concept (A, B) is extended by every
+        attribute j ∉ B after the last one added, giving C = A ∩ {j}↓, D = C↑
+        
+        - Canonicity test: D ∩ Y_j = B ∩ Y_j (Y_j = attributes < j), so each
+          concept is generated exactly once
+        - Failed extensions: a non-canonical D is inherited by the subtree, which
+          then skips j without computing a closure
+        - Iceberg pruning: extents only shrink along a branch, so with
+          min_support > 0 a branch stops as soon as |C| < min_support, as in
+          CHARM's search over tidsets. Only the frequent concepts are visited
+        """
+        return [(frozenset(iter_bits(a)), frozenset(iter_bits(b)))
+                for a, b in self._fcbo_bits(min_support=min_support)]
+    
+    def _fcbo_bits(self, root=None, min_support: int = 0):
+        """
+        Yield the concepts (extent, intent) as bitsets in FCbO order,
+        for the whole search tree or only the subtree below `root`
+        """
+        if root is None:
+            root = self._fcbo_root()
+            if self._extent_size(root[0]) < min_support:
+                return
+        
+        # Stack of (A, B, first attribute to try, failed extensions N_j)
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            yield self._extent_bits(node[0]), node[1]
+            
+            # Push in reverse so children are visited in attribute order
+            stack.extend(reversed(self._fcbo_children(node, min_support)))
+    
+    def _fcbo_root(self):
+        """Search tree root: the top concept (G, G↑)"""
+        return (self._extent_top(), self.up_bits(self.all_objects), 0, [0] * self.n_attributes)
+    
+    # Extent representation used inside the FCbO search; plain bitsets here,
+    # subclasses may use something cheaper for their storage
+    def _extent_top(self):
+        return self.all_objects
+    
+    def _extent_meet(self, a, m: int):
+        """A ∩ m↓"""
+        return a & self.attribute_extent(m)
+    
+    def _extent_intent(self, a) -> int:
+        """A↑ as an attribute bitset"""
+        return self.up_bits(a)
+    
+    def _extent_bits(self, a) -> int:
+        return a
+    
+    def _extent_size(self, a) -> int:
+        return a.bit_count()
+    
+    def _fcbo_children(self, node, min_support: int = 0) -> list:
+        """
+        Canonical children of a search tree node, in attribute order
+        """
+        a, b, y, failed = node
+        if b == self.all_attributes:
+            return []
+        
+        children = []
+        inherited = list(failed)
+        for j in range(y, self.n_attributes):
+            bit = 1 << j
+            if b & bit:
+                continue
+            mask = bit - 1
+            
+            # An ancestor already saw j bring in an attribute < j missing from B
+            if failed[j] & mask & ~b:
+                continue
+            
+            c = self._extent_meet(a, j)
+            if min_support and self._extent_size(c) < min_support:
+                continue
+            d = self._extent_intent(c)
+            if d & mask == b & mask:
+                children.append((c, d, j + 1))
+            else:
+                inherited[j] = d
+        
+        return [(c, d, j, inherited) for c, d, j in children]
+    
+    def parallel_fcbo_algorithm(self, min_support: int = 0, max_workers: int | None = None,
+                                tasks_per_worker: int = 4) -> List[Tuple[FrozenSet[int], FrozenSet[int]]]:
+        """
+        FCbO with the search tree split across worker processes
+        
+        - The top of the tree is expanded level by level until there are about
+          tasks_per_worker independent subtrees per worker
+        - The bitsets are written once to shared memory; workers read them
+          from there instead of receiving a pickled context
+        - Subtree results are merged in tree order, so the output is identical
+          to fcbo_algorithm()
+        """
+        max_workers = max_workers or os.cpu_count() or 1
+        
+        # Plan: ordered mix of concepts found while splitting and open subtrees
+        root = self._fcbo_root()
+        if self._extent_size(root[0]) < min_support:
+            return []
+        plan = [('subtree', root)]
+        while sum(kind == 'subtree' for kind, _ in plan) < tasks_per_worker * max_workers:
+            split = []
+            for kind, item in plan:
+                if kind == 'subtree':
+                    split.append(('concept', (self._extent_bits(item[0]), item[1])))
+                    split.extend(('subtree', child) for child in self._fcbo_children(item, min_support))
+                else:
+                    split.append((kind, item))
+            if len(split) == len(plan):
+                break
+            plan = split
+        
+        tasks = [(self._extent_bits(item[0]),) + item[1:] for kind, item in plan if kind == 'subtree']
+        row_bytes, col_bytes = _n_bytes(self.n_attributes), _n_bytes(self.n_objects)
+        split_at = self.n_objects * row_bytes
+        end = split_at + self.n_attributes * col_bytes
+        shm = shared_memory.SharedMemory(create=True, size=max(1, end))
+        try:
+            shm.buf[:split_at] = b''.join(self.object_intent(g).to_bytes(row_bytes, 'little')
+                                          for g in range(self.n_objects))
+            shm.buf[split_at:end] = b''.join(self.attribute_extent(m).to_bytes(col_bytes, 'little')
+                                             for m in range(self.n_attributes))
+            
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_attach_worker_context,
+                                     initargs=(shm.name, self.n_objects, self.n_attributes)) as executor:
+                subtrees = iter(executor.map(_fcbo_subtree, tasks, repeat(min_support)))
+                concepts = []
+                for kind, item in plan:
+                    if kind == 'concept':
+                        concepts.append(item)
+                    else:
+                        concepts.extend(next(subtrees))
+        finally:
+            shm.close()
+            shm.unlink()
+        
+        return [(frozenset(iter_bits(a)), frozenset(iter_bits(b))) for a, b in concepts]
+    
+    def permuted(self, object_order, attribute_order) -> 'FormalContext':
+        """
+        Copy of the context with objects and attributes renumbered:
+        new object i is the original object object_order[i], likewise for attributes
+        """
+        object_order, attribute_order = np.asarray(object_order), np.asarray(attribute_order)
+        object_pos = np.empty(self.n_objects, dtype=np.int64)
+        object_pos[object_order] = np.arange(self.n_objects)
+        attribute_pos = np.empty(self.n_attributes, dtype=np.int64)
+        attribute_pos[attribute_order] = np.arange(self.n_attributes)
+        
+        context = FormalContext._from_bits(
+            self.n_objects, self.n_attributes,
+            [_compress_bits(self.object_intent(g), self.n_attributes, attribute_pos, self.n_attributes)
+             for g in object_order],
+            [_compress_bits(self.attribute_extent(m), self.n_objects, object_pos, self.n_objects)
+             for m in attribute_order])
+        context.G = [self.G[g] for g in object_order]
+        context.M = [self.M[m] for m in attribute_order]
+        return context
+    
+    def partitioned_algorithm(self, min_support: int = 0, n_partitions: int | None = None,
+                              max_workers: int | None = None,
+                              workdir: str | None = None) -> List[Tuple[FrozenSet[int], FrozenSet[int]]]:
+        """
+        Divide and conquer over objects, exchanging only files
+        
+        - Objects are split into n_partitions contiguous ranges, each written
+          as a native context file
+        - Workers compute the intents of their partition (write_partition_intents)
+          and save them as packed words
+        - Partial results are merged with merge_intents: the intents of a union
+          of object sets are the pairwise intersections B1 ∩ B2 of the intents
+          of the parts
+        Each partition step can run on another machine given the files.
+        Files go to `workdir` if given (and are kept), else a temporary directory.
+        With min_support > 0 the merged concepts are filtered by support.
+        """
+        max_workers = max_workers or os.cpu_count() or 1
+        n_partitions = max(1, min(n_partitions or max_workers, self.n_objects))
+        bounds = np.linspace(0, self.n_objects, n_partitions + 1).astype(int)
+        
+        with tempfile.TemporaryDirectory() as scratch:
+            directory = workdir or scratch
+            os.makedirs(directory, exist_ok=True)
+            context_paths, intent_paths = [], []
+            row_words = _n_words(self.n_attributes)
+            for k in range(n_partitions):
+                objects = range(bounds[k], bounds[k + 1])
+                rows = np.array([_int_to_words(self.object_intent(g), row_words) for g in objects],
+                                dtype='<u8').reshape(len(objects), row_words)
+                path = os.path.join(directory, f'partition_{k}.fca')
+                write_context(PackedFormalContext([self.G[g] for g in objects], self.M, rows), path)
+                context_paths.append(path)
+                intent_paths.append(os.path.join(directory, f'partition_{k}_intents.npy'))
+            
+            with ProcessPoolExecutor(max_workers=min(max_workers, n_partitions)) as executor:
+                parts = list(executor.map(write_partition_intents, context_paths, intent_paths))
+            
+            intents = np.load(parts[0])
+            for path in parts[1:]:
+                intents = merge_intents(intents, np.load(path))
+        
+        concepts = []
+        for words in intents:
+            b = _words_to_int(words)
+            a = self.down_bits(b)
+            if a.bit_count() >= min_support:
+                concepts.append((frozenset(iter_bits(a)), frozenset(iter_bits(b))))
+        return concepts
+    
+    def compute_concepts(self, algorithm: str = 'fcbo', min_support: int = 0,
+                         ordering=None) -> List[Tuple[FrozenSet[int], FrozenSet[int]]]:
+        """
+        Generate all formal concepts with the selected engine:
+        - 'brute_force': test all 2^|G| subsets (generate_all_concepts)
+        - 'next_closure': Ganter's Next Closure (next_closure_algorithm)
+        - 'fcbo': Fast Close-by-One (fcbo_algorithm)
+        - 'parallel_fcbo': FCbO split across processes (parallel_fcbo_algorithm)
+        - 'partitioned': per-partition lattices merged from files (partitioned_algorithm)
+        All engines find the same concepts, possibly in a different order
+        
+        With min_support > 0 only the iceberg lattice is returned: concepts
+        whose extent has at least min_support objects
+        
+        `ordering` renumbers objects and attributes before the search (a name
+        from ORDERINGS or a callable context -> (object_order, attribute_order));
+        the concepts are mapped back to the original indices
+        """
+        if ordering is not None:
+            object_order, attribute_order = _resolve_ordering(ordering)(self)
+            concepts = self.permuted(object_order, attribute_order).compute_concepts(algorithm, min_support)
+            return [(frozenset(int(object_order[g]) for g in A), frozenset(int(attribute_order[m]) for m in B))
+                    for A, B in concepts]
+        
+        engines = {
+            'brute_force': self.generate_all_concepts,
+            'next_closure': self.next_closure_algorithm,
+            'fcbo': self.fcbo_algorithm,
+            'parallel_fcbo': self.parallel_fcbo_algorithm,
+            'partitioned': self.partitioned_algorithm,
+        }
+        if algorithm not in engines:
+            raise ValueError(f"Unknown algorithm '{algorithm}', expected one of {sorted(engines)}")
+        return engines[algorithm](min_support=min_support)
+    
+    def ordering_report(self, algorithm: str = 'fcbo', orderings=None,
+                        min_support: int = 0) -> pd.DataFrame:
+        """
+        Run `algorithm` under each ordering strategy (default: all of ORDERINGS)
+        and report the closures computed, the concepts found and the time taken
+        
+        Next Closure walks the objects and FCbO the attributes, so each engine
+        mostly reacts to one of the two orders. For 'parallel_fcbo' only the
+        closures of the parent process are counted.
+        """
+        rows = {}
+        for name in (orderings if orderings is not None else ORDERINGS):
+            start = time.perf_counter()
+            object_order, attribute_order = _resolve_ordering(name)(self)
+            context = self.permuted(object_order, attribute_order)
+            n_concepts = len(context.compute_concepts(algorithm, min_support))
+            rows[getattr(name, '__name__', name)] = {
+                'closures': context.closure_count,
+                'concepts': n_concepts,
+                'seconds': time.perf_counter() - start,
+            }
+        return pd.DataFrame.from_dict(rows, orient='index').sort_values('closures')
+
+
+def identity_order(context: FormalContext) -> Tuple[np.ndarray, np.ndarray]:
+    """Keep the context as it is"""
+    return np.arange(context.n_objects), np.arange(context.n_attributes)
+
+
+def support_ascending_order(context: FormalContext) -> Tuple[np.ndarray, np.ndarray]:
+    """Objects by |g↑| and attributes by |m↓|, smallest first"""
+    object_sizes = [context.object_intent(g).bit_count() for g in range(context.n_objects)]
+    attribute_sizes = [context.attribute_extent(m).bit_count() for m in range(context.n_attributes)]
+    return np.argsort(object_sizes, kind='stable'), np.argsort(attribute_sizes, kind='stable')
+
+
+def support_descending_order(context: FormalContext) -> Tuple[np.ndarray, np.ndarray]:
+    """Objects by |g↑| and attributes by |m↓|, largest first"""
+    object_order, attribute_order = support_ascending_order(context)
+    return object_order[::-1].copy(), attribute_order[::-1].copy()
+
+
+def greedy_density_order(context: FormalContext) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Dense blocks first: each next attribute is the one sharing the most
+    objects with the attributes already placed (restarting from all objects
+    once their common extent is empty); objects likewise
+    """
+    def greedy(rows: List[int], full: int) -> np.ndarray:
+        remaining = dict(enumerate(rows))
+        common, order = full, []
+        while remaining:
+            i = max(remaining, key=lambda i: ((remaining[i] & common).bit_count(), remaining[i].bit_count()))
+            order.append(i)
+            common &= remaining.pop(i)
+            if not common:
+                common = full
+        return np.array(order, dtype=np.int64)
+    
+    return (greedy([context.object_intent(g) for g in range(context.n_objects)], context.all_attributes),
+            greedy([context.attribute_extent(m) for m in range(context.n_attributes)], context.all_objects))
+
+
+# Ordering strategies for FormalContext.compute_concepts(ordering=...)
+ORDERINGS = {
+    'identity': identity_order,
+    'support_ascending': support_ascending_order,
+    'support_descending': support_descending_order,
+    'greedy_density': greedy_density_order,
+}
+
+
+def _resolve_ordering(ordering):
+    if callable(ordering):
+        return ordering
+    if ordering not in ORDERINGS:
+        raise ValueError(f"Unknown ordering '{ordering}', expected one of {sorted(ORDERINGS)}")
+    return ORDERINGS[ordering]
+
+
+class SparseFormalContext(FormalContext):
+    """
+    Formal context over a scipy.sparse incidence matrix (CSR or CSC)
+    
+    Both a row-major (CSR) and a column-major (CSC) index are kept, so g↑ and
+    m↓ are contiguous sorted index arrays. Derivations intersect these
+    arrays, shortest first. Rows or columns dense enough that a bitset is
+    smaller than their index array are stored as bitsets instead.
+    Created automatically by FormalContext(...) for sparse input.
+    """
+    
+    # Above this many keys, one counting pass beats pairwise intersections
+    scan_threshold = 32
+    
+    def __init__(self, objects: List[str], attributes: List[str], incidence):
+        self.G = objects
+        self.M = attributes
+        self.I = incidence
+        self.n_objects = len(objects)
+        self.n_attributes = len(attributes)
+        self.all_objects = (1 << self.n_objects) - 1
+        self.all_attributes = (1 << self.n_attributes) - 1
+        self.cache = None
+        
+        self.csr = sparse.csr_matrix(incidence, dtype=bool)
+        self.csr.eliminate_zeros()
+        self.csr.sort_indices()
+        self.csc = self.csr.tocsc()
+        self.csc.sort_indices()
+        
+        # An int32 index array costs 32 bits per entry, a bitset 1 bit per cell
+        self.dense_rows = self._dense_bitsets(self.csr, self.n_attributes)
+        self.dense_cols = self._dense_bitsets(self.csc, self.n_objects)
+    
+    @staticmethod
+    def _dense_bitsets(matrix, width: int) -> Dict[int, int]:
+        counts = np.diff(matrix.indptr)
+        return {int(k): _indices_to_bits(matrix.indices[matrix.indptr[k]:matrix.indptr[k + 1]], width)
+                for k in np.flatnonzero(counts * 32 > width)}
+    
+    def object_intent(self, g: int) -> int:
+        if g in self.dense_rows:
+            return self.dense_rows[g]
+        return _indices_to_bits(self.csr.indices[self.csr.indptr[g]:self.csr.indptr[g + 1]], self.n_attributes)
+    
+    def attribute_extent(self, m: int) -> int:
+        if m in self.dense_cols:
+            return self.dense_cols[m]
+        return _indices_to_bits(self.csc.indices[self.csc.indptr[m]:self.csc.indptr[m + 1]], self.n_objects)
+    
+    def _up_bits(self, a: int) -> int:
+        """A↑: intersect the attribute lists of the objects in A"""
+        return self._derive(_bits_to_indices(a, self.n_objects), self.csr, self.dense_rows,
+                            self.n_attributes, self.all_attributes)
+    
+    def _down_bits(self, b: int) -> int:
+        """B↓: intersect the object lists of the attributes in B"""
+        return self._derive(_bits_to_indices(b, self.n_attributes), self.csc, self.dense_cols,
+                            self.n_objects, self.all_objects)
+    
+    def _derive(self, keys: np.ndarray, matrix, dense: Dict[int, int], width: int, full: int) -> int:
+        """
+        Intersection of the index lists of `keys` (rows of CSR or columns of CSC)
+        """
+        if len(keys) > self.scan_threshold:
+            # Count occurrences over all selected lists in one vectorized pass
+            selected = matrix[keys] if matrix.format == 'csr' else matrix[:, keys]
+            counts = np.bincount(selected.indices, minlength=width)
+            return _indices_to_bits(np.flatnonzero(counts == len(keys)), width)
+        
+        result = full
+        lists = []
+        for k in keys.tolist():
+            if k in dense:
+                result &= dense[k]
             else:
-                # Remove element i for next iteration
-                A = A - {i}
+                lists.append(matrix.indices[matrix.indptr[k]:matrix.indptr[k + 1]])
+        if not lists or not result:
+            return result
+        
+        lists.sort(key=len)
+        common = lists[0]
+        for other in lists[1:]:
+            if not len(common):
+                return 0
+            common = _intersect_sorted(common, other)
+        return result & _indices_to_bits(common, width)
+    
+    # FCbO extents are sorted object index arrays, so a search step costs
+    # O(|A|) instead of O(|G|) bitset conversions
+    def _extent_top(self):
+        return np.arange(self.n_objects)
+    
+    def _extent_meet(self, a: np.ndarray, m: int) -> np.ndarray:
+        return _intersect_sorted(a, self.csc.indices[self.csc.indptr[m]:self.csc.indptr[m + 1]])
+    
+    def _extent_intent(self, a: np.ndarray) -> int:
+        return self._derive(a, self.csr, self.dense_rows, self.n_attributes, self.all_attributes)
+    
+    def _extent_bits(self, a: np.ndarray) -> int:
+        return _indices_to_bits(a, self.n_objects)
+    
+    def _extent_size(self, a: np.ndarray) -> int:
+        return len(a)
+    
+    def add_object(self, name: str, row, lattice: 'ConceptLattice | None' = None) -> int:
+        g = self.n_objects
+        row = sparse.csr_matrix(np.asarray(row, dtype=bool).reshape(1, -1))
+        self.__init__(list(self.G) + [name], self.M, sparse.vstack([self.csr, row], format='csr'))
+        if lattice is not None:
+            lattice.add_object(g, self.object_intent(g))
+        return g
+
+
+class PackedFormalContext(FormalContext):
+    """
+    Formal context stored as packed little-endian uint64 words:
+    - rows[g]: g↑, shape (|G|, ⌈|M|/64⌉)
+    - cols[m]: m↓, shape (|M|, ⌈|G|/64⌉)
+    The arrays may be np.memmap views of a context file (see open_context),
+    so opening is instant and worker processes share the same pages.
+    Derivations AND-reduce the selected word rows in NumPy.
+    """
+    
+    def __init__(self, objects: List[str], attributes: List[str],
+                 rows: np.ndarray, cols: np.ndarray | None = None):
+        self.G = objects
+        self.M = attributes
+        self.n_objects = len(objects)
+        self.n_attributes = len(attributes)
+        self.all_objects = (1 << self.n_objects) - 1
+        self.all_attributes = (1 << self.n_attributes) - 1
+        self.cache = None
+        
+        self.rows = rows
+        self.cols = cols if cols is not None else _transpose_packed(rows, self.n_objects, self.n_attributes)
+    
+    @property
+    def I(self) -> np.ndarray:
+        """Incidence matrix, unpacked on demand (uint8, one byte per cell)"""
+        raw = np.ascontiguousarray(self.rows, dtype='<u8').view(np.uint8)
+        return np.unpackbits(raw, axis=1, count=self.n_attributes, bitorder='little')
+    
+    def _packed_words(self) -> Tuple[np.ndarray, np.ndarray]:
+        return self.rows, self.cols
+    
+    def object_intent(self, g: int) -> int:
+        return _words_to_int(self.rows[g])
+    
+    def attribute_extent(self, m: int) -> int:
+        return _words_to_int(self.cols[m])
+    
+    def _up_bits(self, a: int) -> int:
+        if not a:
+            return self.all_attributes
+        return _words_to_int(np.bitwise_and.reduce(self.rows[_bits_to_indices(a, self.n_objects)], axis=0))
+    
+    def _down_bits(self, b: int) -> int:
+        if not b:
+            return self.all_objects
+        return _words_to_int(np.bitwise_and.reduce(self.cols[_bits_to_indices(b, self.n_attributes)], axis=0))
+    
+    def add_object(self, name: str, row, lattice: 'ConceptLattice | None' = None) -> int:
+        raise NotImplementedError("Packed contexts are read-only; rebuild the file to add objects")
+
+
+class ContextReduction:
+    """
+    Mapping from a reduced context (FormalContext.reduce) back to the original
+    
+    - object_groups[i]: original objects merged into reduced object i (bitset)
+    - attribute_groups[j]: original attributes merged into reduced attribute j
+    - reducible_objects: (original objects, their intent in reduced attributes)
+    - reducible_attributes: (original attributes, their extent in reduced objects)
+    
+    A reducible object belongs to the extent of a concept iff the concept's
+    reduced intent is contained in its intent, so concepts expand losslessly.
+    """
+    
+    def __init__(self, n_objects: int, n_attributes: int,
+                 object_groups: List[int], attribute_groups: List[int],
+                 reducible_objects: List[Tuple[int, int]],
+                 reducible_attributes: List[Tuple[int, int]]):
+        self.n_objects = n_objects
+        self.n_attributes = n_attributes
+        self.object_groups = object_groups
+        self.attribute_groups = attribute_groups
+        self.reducible_objects = reducible_objects
+        self.reducible_attributes = reducible_attributes
+    
+    def expand_bits(self, a: int, b: int) -> Tuple[int, int]:
+        """Original (extent, intent) bitsets of the reduced concept (a, b)"""
+        extent = 0
+        for i in iter_bits(a):
+            extent |= self.object_groups[i]
+        for members, intent in self.reducible_objects:
+            if b & intent == b:
+                extent |= members
+        intent = 0
+        for j in iter_bits(b):
+            intent |= self.attribute_groups[j]
+        for members, ext in self.reducible_attributes:
+            if a & ext == a:
+                intent |= members
+        return extent, intent
+    
+    def expand(self, concepts: List[Tuple[FrozenSet[int], FrozenSet[int]]]) -> List[Tuple[FrozenSet[int], FrozenSet[int]]]:
+        """Concepts of the reduced context as concepts of the original one"""
+        expanded = []
+        for A, B in concepts:
+            a, b = self.expand_bits(set_to_bits(A), set_to_bits(B))
+            expanded.append((frozenset(iter_bits(a)), frozenset(iter_bits(b))))
+        return expanded
+
+
+def _group_bits(rows) -> Dict[int, int]:
+    """Group equal bit rows: row -> bitset of the indices having it"""
+    groups: Dict[int, int] = {}
+    for i, row in enumerate(rows):
+        groups[row] = groups.get(row, 0) | (1 << i)
+    return groups
+
+
+def _compress_bits(bits: int, n: int, positions: np.ndarray, width: int) -> int:
+    """Re-index a bitset over {0..n-1} onto kept positions (-1 = dropped)"""
+    kept = positions[_bits_to_indices(bits, n)]
+    return _indices_to_bits(kept[kept >= 0], width)
+
+
+def _n_words(n_bits: int) -> int:
+    """uint64 words needed to store a bitset of n_bits (at least one)"""
+    return max(1, -(-n_bits // 64))
+
+
+def _pack_words(matrix: np.ndarray) -> np.ndarray:
+    """Pack a binary matrix row-wise into little-endian uint64 words"""
+    n_rows, n_cols = matrix.shape
+    packed = np.zeros((n_rows, 8 * _n_words(n_cols)), dtype=np.uint8)
+    packed[:, :_n_bytes(n_cols)] = np.packbits(np.asarray(matrix, dtype=bool), axis=1, bitorder='little')
+    return packed.view('<u8')
+
+
+def _transpose_packed(rows: np.ndarray, n_rows: int, n_cols: int, block: int = 8192) -> np.ndarray:
+    """
+    Column words from row words, unpacking one block of rows at a time so the
+    full matrix never exists unpacked
+    """
+    cols = np.zeros((n_cols, 8 * _n_words(n_rows)), dtype=np.uint8)
+    for start in range(0, n_rows, block):
+        raw = np.ascontiguousarray(rows[start:start + block], dtype='<u8').view(np.uint8)
+        bits = np.unpackbits(raw, axis=1, count=n_cols, bitorder='little')
+        packed = np.packbits(bits.T, axis=1, bitorder='little')
+        cols[:, start // 8:start // 8 + packed.shape[1]] = packed
+    return cols.view('<u8')
+
+
+# Native context file: magic, header (|G|, |M|, name table size), row words,
+# column words, then the JSON name table
+_CONTEXT_MAGIC = b'FCACTX01'
+_CONTEXT_HEADER = len(_CONTEXT_MAGIC) + 3 * 8
+
+
+def write_context(context: FormalContext, path: str):
+    """
+    Save a context in the native binary format read by open_context()
+    """
+    n, m = context.n_objects, context.n_attributes
+    names = json.dumps({'objects': [str(g) for g in context.G],
+                        'attributes': [str(a) for a in context.M]}).encode('utf-8')
+    with open(path, 'wb') as f:
+        f.write(_CONTEXT_MAGIC)
+        f.write(np.array([n, m, len(names)], dtype='<u8').tobytes())
+        for g in range(n):
+            f.write(_int_to_words(context.object_intent(g), _n_words(m)).tobytes())
+        for a in range(m):
+            f.write(_int_to_words(context.attribute_extent(a), _n_words(n)).tobytes())
+        f.write(names)
+
+
+def write_context_blocks(path: str, objects: List[str], attributes: List[str], blocks):
+    """
+    Write a native context file from an iterable of incidence row blocks
+    (binary arrays of shape (k, |M|), in object order), for contexts that do
+    not fit in memory. Rows and columns are written through writable memmaps
+    of the file, one block at a time.
+    """
+    n, m = len(objects), len(attributes)
+    names = json.dumps({'objects': [str(g) for g in objects],
+                        'attributes': [str(a) for a in attributes]}).encode('utf-8')
+    rows_size, cols_size = n * _n_words(m) * 8, m * _n_words(n) * 8
+    with open(path, 'wb') as f:
+        f.write(_CONTEXT_MAGIC)
+        f.write(np.array([n, m, len(names)], dtype='<u8').tobytes())
+        f.seek(_CONTEXT_HEADER + rows_size + cols_size)
+        f.write(names)
+    if not n or not m:
+        if sum(len(block) for block in blocks) != n:
+            raise ValueError(f"Expected {n} incidence rows")
+        return
+    
+    rows = np.memmap(path, dtype='<u8', mode='r+', offset=_CONTEXT_HEADER, shape=(n, _n_words(m)))
+    cols = np.memmap(path, dtype='<u8', mode='r+', offset=_CONTEXT_HEADER + rows_size, shape=(m, _n_words(n)))
+    
+    def flush(block: np.ndarray, g: int):
+        # g is a multiple of 64, so the block starts on a column word boundary
+        words = _pack_words(block)
+        rows[g:g + len(block)] = words
+        cols[:, g // 64:g // 64 + _n_words(len(block))] = _transpose_packed(words, len(block), m)
+    
+    g, pending = 0, np.zeros((0, m), dtype=bool)
+    for block in blocks:
+        pending = np.concatenate([pending, np.asarray(block, dtype=bool)])
+        full = len(pending) // 64 * 64
+        if g + full > n:
+            raise ValueError(f"More than {n} incidence rows")
+        if full:
+            flush(pending[:full], g)
+            g, pending = g + full, pending[full:]
+    if g + len(pending) != n:
+        raise ValueError(f"Expected {n} incidence rows, got {g + len(pending)}")
+    if len(pending):
+        flush(pending, g)
+    rows.flush()
+    cols.flush()
+
+
+def open_context(path: str) -> PackedFormalContext:
+    """
+    Open a native context file; the bit rows and columns are memory-mapped
+    read-only, so only the name table is actually read at startup
+    """
+    with open(path, 'rb') as f:
+        if f.read(len(_CONTEXT_MAGIC)) != _CONTEXT_MAGIC:
+            raise ValueError(f"{path}: not a formal context file")
+        n, m, names_size = (int(x) for x in np.frombuffer(f.read(24), dtype='<u8'))
+        rows_size, cols_size = n * _n_words(m) * 8, m * _n_words(n) * 8
+        f.seek(_CONTEXT_HEADER + rows_size + cols_size)
+        names = json.loads(f.read(names_size).decode('utf-8'))
+    
+    def words(offset, shape):
+        if not shape[0]:
+            return np.zeros(shape, dtype='<u8')
+        return np.memmap(path, dtype='<u8', mode='r', offset=offset, shape=shape)
+    
+    rows = words(_CONTEXT_HEADER, (n, _n_words(m)))
+    cols = words(_CONTEXT_HEADER + rows_size, (m, _n_words(n)))
+    return PackedFormalContext(names['objects'], names['attributes'], rows, cols)
+
+
+class ChunkedFormalContext(PackedFormalContext):
+    """
+    Out-of-core context over a native context file (see write_context and
+    write_context_blocks). Rows and columns stay on disk as packed words and
+    every derivation reads them in blocks of at most memory_budget bytes:
+    - B↓: AND of the columns of B, one block of object words at a time
+    - A↑: AND of the rows of A in bounded batches; when A is a large part of
+      G, the columns are streamed sequentially instead (A ⊆ m↓ per block)
+    Only bitsets of the size of an extent or intent are held in memory.
+    """
+    
+    def __init__(self, path: str, memory_budget: int = 256 * 2**20):
+        packed = open_context(path)
+        super().__init__(packed.G, packed.M, packed.rows, packed.cols)
+        self.memory_budget = memory_budget
+    
+    def _up_bits(self, a: int) -> int:
+        if not a:
+            return self.all_attributes
+        row_words, col_words = self.rows.shape[1], self.cols.shape[1]
+        if a.bit_count() * row_words * 8 > self.n_attributes * col_words:
+            return self._up_bits_by_columns(a)
+        
+        # Object indices come from one slice of the bitset bytes at a time
+        result = np.full(row_words, np.iinfo(np.uint64).max, dtype='<u8')
+        raw = np.frombuffer(a.to_bytes(_n_bytes(self.n_objects), 'little'), dtype=np.uint8)
+        step = max(1, self.memory_budget // (8 * 8 * row_words))  # bytes of the bitset per batch
+        for start in range(0, len(raw), step):
+            index = 8 * start + np.flatnonzero(np.unpackbits(raw[start:start + step], bitorder='little'))
+            if len(index):
+                result &= np.bitwise_and.reduce(self.rows[index], axis=0)
+                if not result.any():
+                    break
+        return _words_to_int(result) & self.all_attributes
+    
+    def _up_bits_by_columns(self, a: int) -> int:
+        """A↑ = {m | A ⊆ m↓}, streaming over blocks of column words"""
+        col_words = self.cols.shape[1]
+        words = _int_to_words(a, col_words)
+        contained = np.ones(self.n_attributes, dtype=bool)
+        step = max(1, self.memory_budget // (8 * max(1, self.n_attributes)))
+        for start in range(0, col_words, step):
+            block = self.cols[:, start:start + step]
+            contained &= ~np.any(words[start:start + step] & ~block, axis=1)
+        return _indices_to_bits(np.flatnonzero(contained), self.n_attributes)
+    
+    def _down_bits(self, b: int) -> int:
+        if not b:
+            return self.all_objects
+        index = _bits_to_indices(b, self.n_attributes)
+        col_words = self.cols.shape[1]
+        result = np.empty(col_words, dtype='<u8')
+        step = max(1, self.memory_budget // (8 * len(index)))
+        for start in range(0, col_words, step):
+            result[start:start + step] = np.bitwise_and.reduce(self.cols[index, start:start + step], axis=0)
+        return _words_to_int(result)
+
+
+def read_cxt(path: str) -> PackedFormalContext:
+    """
+    Read a Burmeister .cxt file:
+    
+        B
+        <optional context name>
+        |G|
+        |M|
+        <blank line>
+        object names (one per line), attribute names (one per line)
+        one row per object of 'X' (has attribute) and '.' (does not)
+    """
+    with open(path, encoding='utf-8') as f:
+        lines = [line.rstrip('\r\n') for line in f]
+    if not lines or lines[0].strip() != 'B':
+        raise ValueError(f"{path}: not a Burmeister context (missing 'B' header)")
+    
+    # Skip the optional name line, then read the two sizes
+    pos = 1
+    while not lines[pos].strip().isdigit():
+        pos += 1
+    n, m = int(lines[pos]), int(lines[pos + 1])
+    pos += 2
+    while pos < len(lines) and not lines[pos].strip():
+        pos += 1
+    
+    objects = lines[pos:pos + n]
+    attributes = lines[pos + n:pos + n + m]
+    table = [row.strip()[:m].ljust(m, '.') for row in lines[pos + n + m:pos + 2 * n + m]]
+    if len(objects) != n or len(attributes) != m or len(table) != n:
+        raise ValueError(f"{path}: truncated context, expected {n} objects and {m} attributes")
+    
+    cells = np.frombuffer(''.join(table).encode('ascii'), dtype=np.uint8).reshape(n, m)
+    return PackedFormalContext(objects, attributes, _pack_words((cells == ord('X')) | (cells == ord('x'))))
+
+
+def read_object_csv(path: str) -> PackedFormalContext:
+    """
+    Read a CSV with one object per line: its name followed by the names of
+    the attributes it has. Attributes are numbered in order of appearance.
+    The bits are set straight into the packed rows, with no dense staging matrix.
+    """
+    objects, attribute_ids = [], {}
+    row_ids, col_ids = [], []
+    with open(path, newline='', encoding='utf-8') as f:
+        for record in csv.reader(f):
+            if not record:
+                continue
+            objects.append(record[0])
+            for name in record[1:]:
+                name = name.strip()
+                if name:
+                    row_ids.append(len(objects) - 1)
+                    col_ids.append(attribute_ids.setdefault(name, len(attribute_ids)))
+    
+    rows = np.zeros((len(objects), 8 * _n_words(len(attribute_ids))), dtype=np.uint8)
+    col_ids = np.array(col_ids, dtype=np.int64)
+    np.bitwise_or.at(rows, (np.array(row_ids, dtype=np.int64), col_ids // 8),
+                     (1 << (col_ids % 8)).astype(np.uint8))
+    return PackedFormalContext(objects, list(attribute_ids), rows.view('<u8'))
+
+
+def _batch_and(words: np.ndarray, selection: np.ndarray, width: int) -> np.ndarray:
+    """
+    AND of the selected word rows for every row of a boolean selection matrix
+    (all ones for an empty selection), unpacked to a (k, width) boolean array
+    """
+    result = _and_segments(words, np.nonzero(selection)[1], selection.sum(axis=1), width)
+    return np.unpackbits(result.view(np.uint8), axis=1, count=width, bitorder='little').astype(bool)
+
+
+def _and_segments(words: np.ndarray, index: np.ndarray, counts: np.ndarray, width: int,
+                  max_cells: int = 2**18) -> np.ndarray:
+    """
+    AND of word rows over consecutive segments of `index`, segment i having
+    counts[i] entries (all ones over `width` bits for an empty segment)
+    Returns packed words of shape (len(counts), n_words). Segments are
+    reduced in chunks gathering at most max_cells words.
+    """
+    k = len(counts)
+    n_words = words.shape[1]
+    result = np.empty((k, n_words), dtype='<u8')
+    result[:] = _int_to_words((1 << width) - 1, n_words)
+    
+    ends = np.cumsum(counts)
+    budget = max(1, max_cells // n_words)
+    start = 0
+    while start < k:
+        first = int(ends[start] - counts[start])
+        stop = max(start + 1, int(np.searchsorted(ends, first + budget, side='right')))
+        chunk = counts[start:stop]
+        nonempty = np.flatnonzero(chunk)
+        if len(nonempty):
+            offsets = (np.cumsum(chunk) - chunk)[nonempty]
+            gathered = words[index[first:int(ends[stop - 1])]]
+            result[start + nonempty] = np.bitwise_and.reduceat(gathered, offsets, axis=0)
+        start = stop
+    return result
+
+
+def _bits_to_indices(bits: int, n: int) -> np.ndarray:
+    """Sorted indices of the set bits of a bitset over {0, ..., n-1}"""
+    raw = np.frombuffer(bits.to_bytes(_n_bytes(n), 'little'), dtype=np.uint8)
+    return np.flatnonzero(np.unpackbits(raw, bitorder='little'))
+
+
+def _indices_to_bits(indices: np.ndarray, n: int) -> int:
+    """Bitset over {0, ..., n-1} with the given indices set"""
+    mask = np.zeros(n, dtype=bool)
+    mask[indices] = True
+    return int.from_bytes(np.packbits(mask, bitorder='little').tobytes(), 'little')
+
+
+def _int_to_words(bits: int, n_words: int) -> np.ndarray:
+    """Bitset as little-endian uint64 words"""
+    return np.frombuffer(bits.to_bytes(8 * n_words, 'little'), dtype='<u8')
+
+
+def _words_to_int(words: np.ndarray) -> int:
+    """Little-endian uint64 words as a bitset"""
+    return int.from_bytes(np.ascontiguousarray(words, dtype='<u8').tobytes(), 'little')
+
+
+def _intersect_sorted(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Intersection of two sorted index arrays (binary search of the shorter one)"""
+    if len(x) > len(y):
+        x, y = y, x
+    if not len(x):
+        return x
+    pos = np.searchsorted(y, x)
+    pos[pos == len(y)] = 0
+    return x[y[pos] == x]
+
+
+class ConceptLattice:
+    """
+    Concept lattice stored as bitsets together with its cover relation:
+    - extents[i], intents[i]: extent and intent of concept i
+    - upper[i]: concepts covering i (next larger extents)
+    - lower[i]: concepts covered by i (next smaller extents)
+    Concept ids never change; new concepts are appended.
+    """
+    
+    def __init__(self, n_attributes: int):
+        self.n_attributes = n_attributes
+        self.extents: List[int] = []
+        self.intents: List[int] = []
+        self.upper: List[Set[int]] = []
+        self.lower: List[Set[int]] = []
+        self.intent_index: Dict[int, int] = {}  # intent bitset -> concept id
+        self.by_intent_size: List[List[int]] = [[] for _ in range(n_attributes + 1)]
+    
+    @classmethod
+    def from_context(cls, context: FormalContext) -> 'ConceptLattice':
+        """
+        Build the lattice incrementally, one object at a time, starting from
+        the lattice of the empty context: the single concept (∅, M)
+        """
+        lattice = cls(context.n_attributes)
+        lattice._add_concept(0, context.all_attributes)
+        for g in range(context.n_objects):
+            lattice.add_object(g, context.object_intent(g))
+        return lattice
+    
+    @classmethod
+    def from_concepts(cls, context: FormalContext,
+                      concepts: List[Tuple[FrozenSet[int], FrozenSet[int]]]) -> 'ConceptLattice':
+        """
+        Wrap an already computed list of concepts (e.g. from compute_concepts)
+        Concept ids follow the list order; covers come from cover_relation()
+        """
+        lattice = cls(context.n_attributes)
+        for A, B in concepts:
+            lattice._add_concept(set_to_bits(A), set_to_bits(B))
+        for l, u in zip(*_lindig_covers(context, lattice.extents, lattice.intents)):
+            lattice._link(int(l), int(u))
+        return lattice
+    
+    def __len__(self) -> int:
+        return len(self.extents)
+    
+    def concepts(self) -> List[Tuple[FrozenSet[int], FrozenSet[int]]]:
+        """All concepts as (extent, intent) frozensets, indexed by concept id"""
+        return [(frozenset(iter_bits(a)), frozenset(iter_bits(b)))
+                for a, b in zip(self.extents, self.intents)]
+    
+    def cover_edges(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Cover relation as integer arrays (lower, upper), like cover_relation()"""
+        pairs = [(l, u) for l, ups in enumerate(self.upper) for u in ups]
+        edges = np.array(pairs, dtype=np.int64).reshape(-1, 2)
+        return edges[:, 0], edges[:, 1]
+    
+    def _add_concept(self, extent: int, intent: int) -> int:
+        i = len(self.extents)
+        self.extents.append(extent)
+        self.intents.append(intent)
+        self.upper.append(set())
+        self.lower.append(set())
+        self.intent_index[intent] = i
+        self.by_intent_size[intent.bit_count()].append(i)
+        return i
+    
+    def _link(self, lower: int, upper: int):
+        self.upper[lower].add(upper)
+        self.lower[upper].add(lower)
+    
+    def _unlink(self, lower: int, upper: int):
+        self.upper[lower].discard(upper)
+        self.lower[upper].discard(lower)
+    
+    def add_object(self, g: int, row: int) -> List[int]:
+        """
+        Godin's incremental update for a new object g with intent g↑ = row
+        
+        Concepts are visited by increasing intent size:
+        - B ⊆ g↑: modified concept, g joins its extent
+        - otherwise D = B ∩ g↑; if D is not an intent yet, the first concept
+          producing it is its generator and (A ∪ {g}, D) is a new concept
+        Only covers around the new concepts change, so the work beyond the
+        scan is proportional to the lattice delta.
+        Returns the ids of the new concepts
+        """
+        bit = 1 << g
+        changed = []  # modified and new concepts: exactly those containing g
+        created = []  # (new concept, generator)
+        
+        for size in range(self.n_attributes + 1):
+            for i in list(self.by_intent_size[size]):
+                b = self.intents[i]
+                if b & row == b:
+                    self.extents[i] |= bit
+                    changed.append(i)
+                    continue
+                d = b & row
+                if d not in self.intent_index:
+                    new = self._add_concept(self.extents[i] | bit, d)
+                    changed.append(new)
+                    created.append((new, i))
+        
+        # Every concept comparable to a new one from above contains g, and
+        # below it lie only its generator and concepts containing g
+        extents = self.extents
+        for new, generator in created:
+            a = extents[new]
+            above = sorted((z for z in changed if extents[z] & a == a and z != new),
+                           key=lambda z: extents[z].bit_count())
+            below = sorted((z for z in changed if extents[z] & a == extents[z] and z != new),
+                           key=lambda z: -extents[z].bit_count())
+            uppers = _extremal(above, extents, lambda x, y: x & y == x)
+            lowers = _extremal(below, extents, lambda x, y: x & y == y) + [generator]
+            
+            # Old covers l ≺ u that now have the new concept in between
+            for l in lowers:
+                for u in list(self.upper[l]):
+                    if extents[u] & a == a:
+                        self._unlink(l, u)
+            for l in lowers:
+                self._link(l, new)
+            for u in uppers:
+                self._link(new, u)
+        
+        return [new for new, _ in created]
+
+
+def cover_relation(context: FormalContext,
+                   concepts: List[Tuple[FrozenSet[int], FrozenSet[int]]]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Cover relation (Hasse diagram edges) of a list of concepts of `context`
+    Returns integer arrays (lower, upper): concepts[lower[k]] is covered by
+    concepts[upper[k]]
+    """
+    return _lindig_covers(context, [set_to_bits(A) for A, _ in concepts],
+                          [set_to_bits(B) for _, B in concepts])
+
+
+def _lindig_covers(context: FormalContext, extents: List[int], intents: List[int]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Lindig's neighbour search on bitsets
+    
+    The lower neighbours of (A, B) are among the concepts (A ∩ m↓, (A ∩ m↓)↑)
+    for m ∉ B. A candidate D is a neighbour unless it also contains another
+    attribute still in `minimal`; a rejected m is dropped from `minimal`, so
+    each neighbour is reported once. Neighbours are found by intent lookup
+    instead of O(n²) subset tests over the concept list.
+    """
+    index = {b: i for i, b in enumerate(intents)}
+    lower, upper = [], []
+    
+    for i, (a, b) in enumerate(zip(extents, intents)):
+        minimal = context.all_attributes & ~b
+        candidates = minimal
+        while candidates:
+            low = candidates & -candidates
+            candidates ^= low
+            d = context.up_bits(a & context.attribute_extent(low.bit_length() - 1))
+            if d & ~b & ~low & minimal:
+                minimal &= ~low
+            elif d in index:
+                lower.append(index[d])
+                upper.append(i)
+    
+    dtype = np.int32 if len(intents) < 2**31 else np.int64
+    return np.array(lower, dtype=dtype), np.array(upper, dtype=dtype)
+
+
+def estimate_stability(context: FormalContext,
+                       concepts: List[Tuple[FrozenSet[int], FrozenSet[int]]],
+                       tolerance: float = 0.02, confidence: float = 0.95,
+                       batch_size: int = 64, max_samples: int = 10_000,
+                       exact_limit: int = 1024, seed: int | None = None,
+                       max_cells: int = 2**22) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Monte Carlo estimate of the (intensional) stability of each concept:
+    σ(A, B) = |{C ⊆ A : C↑ = B}| / 2^|A|
+    
+    Every round draws batch_size uniform subsets C of each unfinished extent
+    and computes all their intents C↑ at once as packed-word AND-reductions.
+    A concept stops sampling once the half-width of its Wilson score interval
+    at the given confidence is at most `tolerance`, or after max_samples.
+    Extents with at most exact_limit subsets are enumerated exactly instead
+    (half-width 0). Each step handles about max_cells extent elements.
+    Returns float arrays (estimate, half_width), one entry per concept.
+    """
+    k = len(concepts)
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    rng = np.random.default_rng(seed)
+    rows, _ = context._packed_words()
+    n_words = rows.shape[1]
+    
+    sizes = np.fromiter((len(A) for A, _ in concepts), dtype=np.int64, count=k)
+    starts = np.cumsum(sizes) - sizes
+    members = np.fromiter(chain.from_iterable(sorted(A) for A, _ in concepts), dtype=np.int64, count=int(sizes.sum()))
+    intents = np.array([_int_to_words(set_to_bits(B), n_words) for _, B in concepts],
+                       dtype='<u8').reshape(k, n_words)
+    successes = np.zeros(k, dtype=np.int64)
+    trials = np.zeros(k, dtype=np.int64)
+    
+    def count_hits(owner: np.ndarray, keep: np.ndarray):
+        # Sample j is the subset of the extent of concepts[owner[j]] whose
+        # elements are flagged in its segment of `keep`
+        lengths = sizes[owner]
+        ends = np.cumsum(lengths)
+        position = np.repeat(starts[owner] - (ends - lengths), lengths) + np.arange(ends[-1])
+        kept = np.concatenate(([0], np.cumsum(keep)))
+        counts = kept[ends] - kept[ends - lengths]
+        sampled = _and_segments(rows, members[position[keep]], counts, context.n_attributes)
+        hits = (sampled == intents[owner]).all(axis=1)
+        successes[:] += np.bincount(owner, weights=hits, minlength=k).astype(np.int64)
+        trials[:] += np.bincount(owner, minlength=k)
+    
+    def chunks(group: np.ndarray, samples: int):
+        # Split a group of concepts so each step draws about max_cells elements
+        ends = np.cumsum(sizes[group] * samples)
+        if not len(ends) or ends[-1] <= max_cells:
+            return [group] if len(group) else []
+        bounds = np.searchsorted(ends, np.arange(max_cells, ends[-1], max_cells), side='right')
+        return [c for c in np.split(group, np.unique(np.clip(bounds, 1, len(group)))) if len(c)]
+    
+    # Small extents: enumerate all 2^|A| subsets through the bits of 0..2^|A|-1
+    exact_bits = max(0, exact_limit.bit_length() - 1)
+    for size in range(exact_bits + 1):
+        subsets = ((np.arange(2**size)[:, np.newaxis] >> np.arange(size)) & 1).astype(bool).ravel()
+        for chunk in chunks(np.flatnonzero(sizes == size), 2**size):
+            count_hits(np.repeat(chunk, 2**size), np.tile(subsets, len(chunk)))
+    half_width = np.where(sizes <= exact_bits, 0.0, 1.0)
+    
+    # Larger extents: batches of uniform subsets (each element kept with probability 1/2)
+    active = np.flatnonzero(sizes > exact_bits)
+    while len(active):
+        for chunk in chunks(active, batch_size):
+            owner = np.repeat(chunk, batch_size)
+            n_elements = int(sizes[owner].sum())
+            keep = np.unpackbits(rng.integers(0, 256, size=-(-n_elements // 8), dtype=np.uint8),
+                                 count=n_elements).view(bool)
+            count_hits(owner, keep)
+        
+        n, p = trials[active], successes[active] / trials[active]
+        half_width[active] = z * np.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / (1 + z * z / n)
+        active = active[(half_width[active] > tolerance) & (trials[active] < max_samples)]
+    
+    return successes / np.maximum(trials, 1), half_width
+
+
+def _extremal(candidates: List[int], extents: List[int], dominated) -> List[int]:
+    """
+    Keep the candidates not dominated by an earlier kept one
+    (candidates must be sorted so that dominating elements come first)
+    """
+    kept = []
+    for z in candidates:
+        if not any(dominated(extents[k], extents[z]) for k in kept):
+            kept.append(z)
+    return kept
+
+
+class ConceptIndex:
+    """
+    Read-only lookup structure over a computed lattice, for online queries:
+    - intent bitset -> concept id (hash map)
+    - upper-neighbour table in CSR form: the concepts covering i are
+      upper_ids[upper_ptr[i]:upper_ptr[i + 1]]
+    
+    The context is kept to close attribute sets that are not intents; the
+    lookup itself never scans the concept list.
+    """
+    
+    def __init__(self, context: FormalContext,
+                 concepts: List[Tuple[FrozenSet[int], FrozenSet[int]]],
+                 covers: Tuple[np.ndarray, np.ndarray] | None = None):
+        self.context = context
+        self.extents = [set_to_bits(A) for A, _ in concepts]
+        self.intents = [set_to_bits(B) for _, B in concepts]
+        if covers is None:
+            covers = _lindig_covers(context, self.extents, self.intents)
+        self._build(covers)
+    
+    @classmethod
+    def from_lattice(cls, context: FormalContext, lattice: ConceptLattice) -> 'ConceptIndex':
+        """Index a ConceptLattice, reusing its bitsets and cover relation"""
+        index = cls.__new__(cls)
+        index.context = context
+        index.extents = list(lattice.extents)
+        index.intents = list(lattice.intents)
+        index._build(lattice.cover_edges())
+        return index
+    
+    def _build(self, covers: Tuple[np.ndarray, np.ndarray]):
+        self.intent_index: Dict[int, int] = {b: i for i, b in enumerate(self.intents)}
+        lower, upper = (np.asarray(x, dtype=np.int64) for x in covers)
+        order = np.argsort(lower, kind='stable')
+        self.upper_ids = upper[order]
+        self.upper_ptr = np.zeros(len(self.intents) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(lower, minlength=len(self.intents)), out=self.upper_ptr[1:])
+    
+    def __len__(self) -> int:
+        return len(self.intents)
+    
+    def concept_of(self, attributes: Set[int]) -> int | None:
+        """
+        Id of the concept generated by an attribute set X, i.e. with intent X↓↑
+        (None if that concept is not in the index, e.g. below an iceberg cut)
+        """
+        b = set_to_bits(attributes)
+        i = self.intent_index.get(b)
+        if i is None:
+            i = self.intent_index.get(self.context.intent_closure_bits(b))
+        return i
+    
+    def upper_neighbours(self, i: int) -> np.ndarray:
+        """Ids of the concepts covering concept i"""
+        return self.upper_ids[self.upper_ptr[i]:self.upper_ptr[i + 1]]
+    
+    def objects_matching(self, intent: Set[int]) -> FrozenSet[int]:
+        """Objects having every attribute of `intent`: the extent of its concept"""
+        i = self.concept_of(intent)
+        a = self.extents[i] if i is not None else self.context.down_bits(set_to_bits(intent))
+        return frozenset(iter_bits(a))
+
+
+class CompactLattice:
+    """
+    Columnar lattice: extents and intents in CSR form, cover edges and supports
+    - extent_idx[extent_ptr[i]:extent_ptr[i + 1]]: sorted objects of concept i
+    - intent_idx[intent_ptr[i]:intent_ptr[i + 1]]: sorted attributes of concept i
+    - cover_lower[k] is covered by cover_upper[k]
+    - support[i] = |extent of i|
+    About 4 bytes per extent/intent element, against ~200 for frozensets.
+    The arrays may be read-only memmaps of a lattice directory (open_lattice).
+    """
+    
+    _arrays = ('extent_ptr', 'extent_idx', 'intent_ptr', 'intent_idx',
+               'cover_lower', 'cover_upper', 'support')
+    
+    def __init__(self, n_objects: int, n_attributes: int, **arrays: np.ndarray):
+        self.n_objects = n_objects
+        self.n_attributes = n_attributes
+        for name in self._arrays:
+            setattr(self, name, arrays[name])
+    
+    @classmethod
+    def from_concepts(cls, context: FormalContext,
+                      concepts: List[Tuple[FrozenSet[int], FrozenSet[int]]],
+                      covers: Tuple[np.ndarray, np.ndarray] | None = None) -> 'CompactLattice':
+        """Pack a list of concepts; covers are computed unless given"""
+        def csr(sets, n):
+            sizes = np.fromiter((len(x) for x in sets), dtype=np.int64, count=len(sets))
+            ptr = np.zeros(len(sets) + 1, dtype=np.int64)
+            np.cumsum(sizes, out=ptr[1:])
+            idx = np.fromiter(chain.from_iterable(sorted(x) for x in sets),
+                              dtype=np.int32 if n < 2**31 else np.int64, count=int(ptr[-1]))
+            return ptr, idx
+        
+        extent_ptr, extent_idx = csr([A for A, _ in concepts], context.n_objects)
+        intent_ptr, intent_idx = csr([B for _, B in concepts], context.n_attributes)
+        if covers is None:
+            covers = cover_relation(context, concepts)
+        return cls(context.n_objects, context.n_attributes,
+                   extent_ptr=extent_ptr, extent_idx=extent_idx,
+                   intent_ptr=intent_ptr, intent_idx=intent_idx,
+                   cover_lower=np.asarray(covers[0], dtype=np.int64),
+                   cover_upper=np.asarray(covers[1], dtype=np.int64),
+                   support=np.diff(extent_ptr))
+    
+    def __len__(self) -> int:
+        return len(self.extent_ptr) - 1
+    
+    def extent(self, i: int) -> np.ndarray:
+        return self.extent_idx[self.extent_ptr[i]:self.extent_ptr[i + 1]]
+    
+    def intent(self, i: int) -> np.ndarray:
+        return self.intent_idx[self.intent_ptr[i]:self.intent_ptr[i + 1]]
+    
+    def concepts(self) -> List[Tuple[FrozenSet[int], FrozenSet[int]]]:
+        """All concepts as (extent, intent) frozensets"""
+        extents, intents = np.asarray(self.extent_idx).tolist(), np.asarray(self.intent_idx).tolist()
+        ep, ip = np.asarray(self.extent_ptr).tolist(), np.asarray(self.intent_ptr).tolist()
+        return [(frozenset(extents[ep[i]:ep[i + 1]]), frozenset(intents[ip[i]:ip[i + 1]]))
+                for i in range(len(self))]
+    
+    def cover_edges(self) -> Tuple[np.ndarray, np.ndarray]:
+        return self.cover_lower, self.cover_upper
+    
+    def save(self, path: str):
+        """Write the arrays as .npy files in directory `path`"""
+        os.makedirs(path, exist_ok=True)
+        np.save(os.path.join(path, 'shape.npy'), np.array([self.n_objects, self.n_attributes], dtype=np.int64))
+        for name in self._arrays:
+            np.save(os.path.join(path, f'{name}.npy'), np.ascontiguousarray(getattr(self, name)))
+
+
+def write_lattice(context: FormalContext, concepts: List[Tuple[FrozenSet[int], FrozenSet[int]]],
+                  path: str, covers: Tuple[np.ndarray, np.ndarray] | None = None) -> CompactLattice:
+    """
+    Save concepts (and their cover relation) as a lattice directory
+    readable by open_lattice(); returns the packed lattice
+    """
+    lattice = CompactLattice.from_concepts(context, concepts, covers)
+    lattice.save(path)
+    return lattice
+
+
+def open_lattice(path: str, mmap_mode: str | None = 'r') -> CompactLattice:
+    """
+    Open a lattice directory; by default every array is memory-mapped
+    read-only, so reloading costs a few file opens whatever the size
+    """
+    n_objects, n_attributes = (int(x) for x in np.load(os.path.join(path, 'shape.npy')))
+    arrays = {name: np.load(os.path.join(path, f'{name}.npy'), mmap_mode=mmap_mode)
+              for name in CompactLattice._arrays}
+    return CompactLattice(n_objects, n_attributes, **arrays)
+
+
+def association_rules(context: FormalContext,
+                      concepts: List[Tuple[FrozenSet[int], FrozenSet[int]]],
+                      min_confidence: float = 0.5, min_support: int = 0,
+                      covers: Tuple[np.ndarray, np.ndarray] | None = None):
+    """
+    Yield the Luxenburger basis of partial association rules, one rule per
+    cover edge (lower, upper) of the lattice:
+    
+        intent(upper) → intent(lower) minus intent(upper)
+        support = |extent(lower)|, confidence = |extent(lower)| / |extent(upper)|
+    
+    Together with the exact rules of canonical_basis(), these generate every
+    rule of the context. Supports are extent popcounts, so the data is never
+    rescanned. Rules are yielded as (premise, conclusion, support, confidence)
+    in decreasing confidence, when support ≥ min_support and confidence ≥
+    min_confidence.
+    """
+    extents = [set_to_bits(A) for A, _ in concepts]
+    intents = [set_to_bits(B) for _, B in concepts]
+    if covers is None:
+        covers = _lindig_covers(context, extents, intents)
+    lower, upper = (np.asarray(x, dtype=np.int64) for x in covers)
+    
+    support = np.fromiter((a.bit_count() for a in extents), dtype=np.int64, count=len(extents))
+    confidence = support[lower] / np.maximum(support[upper], 1)
+    keep = np.flatnonzero((support[lower] >= min_support) & (confidence >= min_confidence))
+    for k in keep[np.argsort(-confidence[keep], kind='stable')]:
+        l, u = lower[k], upper[k]
+        yield (frozenset(iter_bits(intents[u])), frozenset(iter_bits(intents[l] & ~intents[u])),
+               int(support[l]), float(confidence[k]))
+
+
+class Implications:
+    """
+    Attribute implications P → C stored as bitsets, closed with LinClosure
+    (Beeri & Bernstein): each implication counts the premise attributes not
+    derived yet and fires when its counter reaches zero. Every attribute is
+    processed once, so a closure is linear in the number of implications
+    times the attributes it derives.
+    
+    The counters live in NumPy arrays: a round decrements all of them for the
+    attributes derived in the previous round and fires every implication that
+    reached zero, with no Python loop over implications.
+    """
+    
+    def __init__(self, n_attributes: int):
+        self.n_attributes = n_attributes
+        self.premises: List[int] = []
+        self.conclusions: List[int] = []
+        
+        # Growable arrays: premise incidence (one row per attribute, so the
+        # counters of an attribute are contiguous), premise sizes, packed conclusions
+        self._n_words = _n_words(n_attributes)
+        self._premise_matrix = np.zeros((n_attributes, 16), dtype=np.uint8)
+        self._premise_sizes = np.zeros(16, dtype=np.int32)
+        self._conclusion_words = np.zeros((16, self._n_words), dtype=np.uint64)
+    
+    def __len__(self) -> int:
+        return len(self.premises)
+    
+    def add(self, premise: int, conclusion: int):
+        i = len(self.premises)
+        if i == len(self._premise_sizes):
+            self._premise_matrix = np.concatenate([self._premise_matrix, np.zeros_like(self._premise_matrix)], axis=1)
+            self._premise_sizes = np.concatenate([self._premise_sizes, np.zeros_like(self._premise_sizes)])
+            self._conclusion_words = np.concatenate([self._conclusion_words, np.zeros_like(self._conclusion_words)])
         
-        return None  # No more closed sets
+        self.premises.append(premise)
+        self.conclusions.append(conclusion)
+        self._premise_matrix[_bits_to_indices(premise, self.n_attributes), i] = 1
+        self._premise_sizes[i] = premise.bit_count()
+        self._conclusion_words[i] = _int_to_words(conclusion, self._n_words)
+    
+    def closure_bits(self, x: int) -> int:
+        """Smallest superset of X respecting every implication (LinClosure)"""
+        n = len(self.premises)
+        remaining = self._premise_sizes[:n].copy()
+        fired = np.zeros(n, dtype=bool)
+        closed = pending = x
+        while True:
+            if pending:
+                derived = _bits_to_indices(pending, self.n_attributes)
+                remaining -= self._premise_matrix[derived, :n].sum(axis=0, dtype=np.int32)
+            ready = np.flatnonzero((remaining == 0) & ~fired)
+            if not len(ready):
+                return closed
+            fired[ready] = True
+            pending = _words_to_int(np.bitwise_or.reduce(self._conclusion_words[ready], axis=0)) & ~closed
+            closed |= pending
+    
+    def closure(self, B: Set[int]) -> Set[int]:
+        return bits_to_set(self.closure_bits(set_to_bits(B)))
+    
+    def follows(self, premise: Set[int], conclusion: Set[int]) -> bool:
+        """Check if premise → conclusion is entailed by the implications"""
+        c = set_to_bits(conclusion)
+        return self.closure_bits(set_to_bits(premise)) & c == c
+    
+    def implications(self) -> List[Tuple[FrozenSet[int], FrozenSet[int]]]:
+        return [(frozenset(iter_bits(p)), frozenset(iter_bits(c)))
+                for p, c in zip(self.premises, self.conclusions)]
+
+
+def write_partition_intents(context_path: str, out_path: str) -> str:
+    """
+    Partition worker: compute all intents of a native context file with FCbO
+    and save them as packed words (np.save, shape (k, ⌈|M|/64⌉))
+    Returns out_path
+    """
+    packed = open_context(context_path)
+    context = FormalContext._from_bits(
+        packed.n_objects, packed.n_attributes,
+        [packed.object_intent(g) for g in range(packed.n_objects)],
+        [packed.attribute_extent(m) for m in range(packed.n_attributes)])
+    row_words = _n_words(context.n_attributes)
+    intents = [_int_to_words(b, row_words) for _, b in context._fcbo_bits()]
+    np.save(out_path, np.array(intents, dtype='<u8').reshape(len(intents), row_words))
+    return out_path
+
+
+def merge_intents(left: np.ndarray, right: np.ndarray, max_cells: int = 2**22) -> np.ndarray:
+    """
+    Intents of the union of two disjoint object sets, from the packed intents
+    of each: all intersections B1 ∩ B2 (each is closed, and every intent of
+    the union arises this way), as sorted unique packed words
+    
+    Every right intent is an intersection of meet-irreducible ones, so left
+    is closed under intersection with each irreducible right intent in turn
+    instead of forming all |left|·|right| pairs.
+    """
+    n_words = left.shape[1]
+    if n_words == 1:
+        key_type = np.dtype('<u8')
+    else:
+        key_type = np.dtype((np.void, 8 * n_words))
+    
+    def keys(words):
+        return np.ascontiguousarray(words).view(key_type).ravel()
+    
+    merged = np.unique(keys(np.concatenate([left, right])))
+    for r in _meet_irreducible(right, max_cells):
+        words = merged.view('<u8').reshape(-1, n_words)
+        merged = np.union1d(merged, keys(words & r))
+    return merged.view('<u8').reshape(-1, n_words)
+
+
+def _meet_irreducible(intents: np.ndarray, max_cells: int = 2**22) -> np.ndarray:
+    """Intents that are not the intersection of the strictly larger intents"""
+    k, n_words = intents.shape
+    keep = np.zeros(k, dtype=bool)
+    step = max(1, max_cells // max(1, k * n_words))
+    for start in range(0, k, step):
+        block = intents[start:start + step, np.newaxis, :]
+        contains = np.all(intents[np.newaxis, :, :] & block == block, axis=2)
+        strict = contains & np.any(intents[np.newaxis, :, :] != block, axis=2)
+        meet = np.bitwise_and.reduce(np.where(strict[:, :, np.newaxis], intents[np.newaxis, :, :],
+                                              np.uint64(np.iinfo(np.uint64).max)), axis=1)
+        keep[start:start + step] = np.any(meet != block[:, 0, :], axis=1)
+    return intents[keep]
+
+
+# Context of the current parallel worker process, rebuilt from shared memory
+_worker_context = None
+
+
+def _attach_worker_context(shm_name: str, n_objects: int, n_attributes: int):
+    """
+    Worker initializer: read the context bitsets from shared memory
+    (rows first, then columns)
+    """
+    global _worker_context
+    row_bytes, col_bytes = _n_bytes(n_attributes), _n_bytes(n_objects)
+    split_at = n_objects * row_bytes
+    
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        row_bits = [int.from_bytes(shm.buf[g * row_bytes:(g + 1) * row_bytes], 'little')
+                    for g in range(n_objects)]
+        col_bits = [int.from_bytes(shm.buf[split_at + m * col_bytes:split_at + (m + 1) * col_bytes], 'little')
+                    for m in range(n_attributes)]
+    finally:
+        shm.close()
+    
+    _worker_context = FormalContext._from_bits(n_objects, n_attributes, row_bits, col_bits)
+
+
+def _fcbo_subtree(root, min_support: int = 0) -> List[Tuple[int, int]]:
+    """Worker task: all concepts (as bitsets) of one FCbO subtree"""
+    return list(_worker_context._fcbo_bits(root, min_support))
 
 
 def create_example_context_1() -> FormalContext:
@@ -327,16 +2157,21 @@ def test_closure_theorem(context: FormalContext, context_name: str):
     
     print(f"Total Concepts Found: {len(concepts_next)}")
     
-    # Verify both methods find the same concepts
+    # Generate concepts using Fast Close-by-One
+    concepts_fcbo = context.compute_concepts(algorithm='fcbo')
+    
+    # Verify all methods find the same concepts
     set_brute = set(concepts_brute)
     set_next = set(concepts_next)
+    set_fcbo = set(concepts_fcbo)
     
     print(f"\n{'='*100}")
     print(f"THEOREM VERIFICATION:")
     print(f"{'='*100}")
     print(f"Concepts from Brute Force:    {len(set_brute)}")
     print(f"Concepts from Next Closure:   {len(set_next)}")
-    print(f"Sets are identical:           {set_brute == set_next}")
+    print(f"Concepts from FCbO:           {len(set_fcbo)}")
+    print(f"Sets are identical:           {set_brute == set_next == set_fcbo}")
     print(f"\n✓ THEOREM CONFIRMED: All formal concepts are found by closure operations!")
     print(f"{'='*100}")
     
@@ -458,6 +2293,7 @@ Key Property:
     
     # Plot concepts as nodes
     max_level_size = max(len(v) for v in levels.values())
+    positions = {}
     
     for size, concept_indices in levels.items():
         n_at_level = len(concept_indices)
@@ -465,6 +2301,7 @@ Key Property:
         
         for j, idx in enumerate(concept_indices):
             x = (j + 1) * (max_level_size + 1) / (n_at_level + 1)
+            positions[idx] = (x, y)
             
             A, B = concepts[idx]
             color = plt.cm.get_cmap('coolwarm')(size / (context.n_objects + 1))
@@ -474,6 +2311,11 @@ Key Property:
             ax5.text(x, y, f'{idx+1}', ha='center', va='center', 
                     fontweight='bold', fontsize=9)
     
+    # Plot cover relation (Hasse diagram edges)
+    for lower, upper in zip(*cover_relation(context, concepts)):
+        (x0, y0), (x1, y1) = positions[lower], positions[upper]
+        ax5.plot([x0, x1], [y0, y1], color='gray', linewidth=1, zorder=1)
+    
     ax5.set_xlabel('Position', fontsize=10, fontweight='bold')
     ax5.set_ylabel('Extent Size |A|', fontsize=10, fontweight='bold')
     ax5.set_title('Concept Lattice Structure\n(ordered by extent size)', 